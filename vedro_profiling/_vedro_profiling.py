@@ -1,36 +1,41 @@
-import json
+import importlib
 import os
 import threading
+import time
 import warnings
+from array import array
 from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Any, Type, TypedDict
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Generator, Type, TypedDict, cast
 
-import docker
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+import orjson
 import psutil
-from docker import errors as docker_errors
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from numpy.typing import NDArray
 from vedro.core import Dispatcher, Plugin, PluginConfig
 from vedro.events import ArgParsedEvent, ArgParseEvent, CleanupEvent, StartupEvent
 
+# Headless rendering only: never resolve a GUI toolkit for the plots
+matplotlib.use("Agg")
 
-# Type aliases for better type safety
-class DataPointData(TypedDict):
-    """Data structure for a profiling data point."""
-    time: str
-    value: float
-    tags: dict[str, str]
 
+# Type aliases for better type safety
+class MetricSeries(TypedDict):
+    """Columnar buffers for one metric series (structure-of-arrays layout)."""
+    timestamps: "array[int]"  # int64 nanoseconds since epoch
+    values: "array[float]"
 
-class DataPoint(TypedDict):
-    """Complete data point structure for profiling metrics."""
-    type: str
-    metric: str
-    data: DataPointData
 
+# Series are keyed by (metric, target, method); tags are derived from the
+# key at serialization time instead of being duplicated per point
+SeriesKey = tuple[str, str, str]
 
-MetricStats = dict[str, list[Any]]  # Contains CPU, MEM lists and timestamps
+MetricStats = dict[str, Any]  # CPU/MEM value arrays and their timestamp arrays
 StatsDict = dict[str, MetricStats]
 
 
@@ -49,15 +54,24 @@ class VedroProfilingPlugin(Plugin):
         self._profiling_run_id: str | None = config.profiling_run_id
         self._additional_tags: dict[str, str] = config.additional_tags
         
-        # New data structure for k6-compatible format
-        self._data_points: list[DataPoint] = []
+        # Columnar storage for the k6-compatible format: per-series
+        # timestamp/value columns instead of one dict per point. Each
+        # collector thread owns its buffer exclusively; the buffers are
+        # only merged at cleanup, after the collectors have stopped.
+        self._docker_series: dict[SeriesKey, MetricSeries] = {}
+        self._psutil_series: dict[SeriesKey, MetricSeries] = {}
         self._metrics_definitions: dict[str, dict[str, str]] = {
             "cpu_percent": {"type": "gauge", "unit": "percent"},
             "memory_usage": {"type": "gauge", "unit": "megabytes"}
         }
         self._run_id: str = ""
+        self._encode_point: Callable[[str, str, float, str, str], bytes] | None = None
+
+        # Points are streamed to the NDJSON log as they are collected, so
+        # log memory stays O(1) and partial data survives a killed run
+        self._log_fh: BinaryIO | None = None
+        self._log_lock: threading.Lock = threading.Lock()
 
-        self._running: bool = False
         self._stop_event: threading.Event = threading.Event()
         self._docker_thread: threading.Thread | None = None
         self._psutil_thread: threading.Thread | None = None
@@ -95,163 +109,318 @@ class VedroProfilingPlugin(Plugin):
         if event.args.run_id:
             self._profiling_run_id = event.args.run_id
 
-    def _create_data_point(
+    def _get_series(
         self,
+        buffers: dict[SeriesKey, MetricSeries],
         metric: str,
-        value: float,
         target: str,
-        method: str,
-        timestamp: str | None = None
-    ) -> DataPoint:
-        """Create a standardized data point for profiling metrics."""
-        if timestamp is None:
-            timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-        
-        return {
-            "type": "Point",
-            "metric": metric,
-            "data": {
-                "time": timestamp,
-                "value": value,
-                "tags": {
-                    "target": target,
-                    "method": method,
-                    "run": self._run_id,
-                    **self._additional_tags
-                }
-            }
-        }
+        method: str
+    ) -> MetricSeries:
+        """Get or create the column buffers of a series."""
+        key = (metric, target, method)
+        series = buffers.get(key)
+        if series is None:
+            series = {"timestamps": array("q"), "values": array("d")}
+            buffers[key] = series
+        return series
+
+    def _wait_next_tick(self, deadline: float) -> float:
+        """Drift-corrected sleep until the next poll deadline.
+
+        Keeps samples evenly spaced regardless of how long a tick took;
+        wakes early if the stop event fires. Returns the next deadline.
+        """
+        deadline += self._poll_time
+        sleep_for = deadline - time.monotonic()
+        if sleep_for <= 0:
+            # Slow tick: rebase on the clock instead of bursting to catch up
+            return time.monotonic() + self._poll_time
+        self._stop_event.wait(sleep_for)
+        return deadline
+
+    def _merged_series(self) -> dict[SeriesKey, MetricSeries]:
+        """Merge the per-collector buffers; only safe once collectors stopped."""
+        return {**self._docker_series, **self._psutil_series}
+
+    def _compile_point_encoder(self) -> Callable[[str, str, float, str, str], bytes]:
+        """Generate an NDJSON point serializer specialized for this run.
+
+        The point schema is fixed once the run id and additional tags are
+        known, so the constant tail of the tag object is pre-serialized and
+        the whole line becomes a single f-string instead of a nested dict
+        walked by a generic JSON encoder per point.
+        """
+        fixed = orjson.dumps(
+            {"run": self._run_id, **self._additional_tags}
+        ).decode()[1:-1]
+
+        template = (
+            '{"type":"Point","metric":"@metric@",'
+            '"data":{"time":"@ts@","value":@value@,'
+            '"tags":{"target":"@target@","method":"@method@",@fixed@}}}'
+        )
+        template = template.replace("{", "{{").replace("}", "}}")
+        for field in ("metric", "ts", "value", "target", "method", "fixed"):
+            template = template.replace(f"@{field}@", "{" + field + "}")
+
+        src = (
+            "def encode_point(metric: str, ts: str, value: float,"
+            " target: str, method: str) -> bytes:\n"
+            f"    return f'{template}\\n'.encode()\n"
+        )
+        namespace: dict[str, Any] = {"fixed": fixed}
+        exec(src, namespace)
+        return cast(Callable[[str, str, float, str, str], bytes], namespace["encode_point"])
+
+    def _stream_container_stats(
+        self,
+        api: Any,
+        container_id: str,
+        latest: dict[str, dict[str, Any]],
+        responses: dict[str, Any]
+    ) -> None:
+        """Keep the latest decoded stats sample for a single container.
+
+        The raw byte stream is read over docker-py's persistent session and
+        frames are decoded with orjson, bypassing the stdlib-json stream
+        helper that dominates per-frame cost in docker-py itself. The HTTP
+        response is shared via ``responses`` so the sampler can close it on
+        shutdown and unblock this thread mid-read.
+        """
+        docker_errors = importlib.import_module("docker.errors")
+        response = api._get(
+            api._url("/containers/{0}/stats", container_id),
+            stream=True,
+            params={"stream": "1"}
+        )
+        responses[container_id] = response
+        buffer = b""
+        try:
+            for chunk in response.iter_content(chunk_size=None):
+                # One newline-delimited JSON frame per stats sample
+                buffer += chunk
+                while (end := buffer.find(b"\n")) != -1:
+                    line, buffer = buffer[:end], buffer[end + 1:]
+                    if line.strip():
+                        latest[container_id] = orjson.loads(line)
+                if self._stop_event.is_set():
+                    break
+        except (docker_errors.APIError, OSError, ValueError, orjson.JSONDecodeError):
+            # OSError covers the requests exceptions raised when the
+            # sampler closes the response under us; ValueError covers
+            # reads from the already-closed raw stream
+            pass
+        finally:
+            # Close the underlying HTTP stream to release the socket
+            response.close()
+            responses.pop(container_id, None)
+            latest.pop(container_id, None)
 
     def _collect_docker_stats(self) -> None:
+        # Deferred so importing the plugin never pays the docker import
+        # (or a socket handshake) when docker profiling isn't used
+        docker = importlib.import_module("docker")
+        docker_errors = importlib.import_module("docker.errors")
         try:
             client = docker.from_env()
         except docker_errors.DockerException:
             warnings.warn("Docker is unavailable, containers metrics are disabled.")
             return
 
-        containers = client.containers.list(
-            filters={
-                "label": [
-                    "com.docker.compose.project=" + self._docker_compose_project_name
-                ]
-            }
-        )
-        if not containers:
+        filters: dict[str, str | list[str] | bool] = {
+            "label": [
+                "com.docker.compose.project=" + self._docker_compose_project_name
+            ]
+        }
+
+        # Each container gets its own streaming reader thread that keeps
+        # the latest decoded sample here; the loop below only reads the
+        # cache, so one slow container never stalls the whole tick. The
+        # per-container streams are all in flight concurrently, so tick
+        # latency stays O(1) in the number of containers.
+        latest: dict[str, dict[str, Any]] = {}
+        names: dict[str, str] = {}
+        streams: dict[str, threading.Thread] = {}
+        # Raw HTTP responses of the stats streams, owned here so shutdown
+        # can close them and unblock readers stuck waiting for a frame
+        responses: dict[str, Any] = {}
+
+        def refresh_streams() -> None:
+            try:
+                containers = client.containers.list(filters=filters)
+            except docker_errors.APIError:
+                return
+            for container in containers:
+                container_id = container.id or ""
+                if container_id in streams and streams[container_id].is_alive():
+                    continue
+                names[container_id] = container.name or "unknown"
+                thread = threading.Thread(
+                    target=self._stream_container_stats,
+                    args=(client.api, container_id, latest, responses),
+                    daemon=True,
+                    name=f"vedro-profiling-docker-{container.short_id}"
+                )
+                streams[container_id] = thread
+                thread.start()
+
+        # Re-list containers only when the daemon reports a lifecycle
+        # change instead of paying a list round-trip every cycle
+        refresh_needed = threading.Event()
+
+        def watch_events() -> None:
+            events = cast(
+                Generator[dict[str, Any], None, None],
+                client.events(
+                    decode=True,
+                    filters={"type": ["container"], "event": ["start", "die"]}
+                )
+            )
+            try:
+                for _ in events:
+                    refresh_needed.set()
+                    if self._stop_event.is_set():
+                        break
+            except (docker_errors.APIError, OSError):
+                pass
+            finally:
+                events.close()
+
+        refresh_streams()
+        if not streams:
             warnings.warn("No containers found for profiling.")
             return
 
+        threading.Thread(
+            target=watch_events,
+            daemon=True,
+            name="vedro-profiling-docker-events"
+        ).start()
+
+        # Series buffers per container, resolved once instead of per sample
+        series_cache: dict[str, tuple[str, MetricSeries, MetricSeries]] = {}
+
+        deadline = time.monotonic()
         while not self._stop_event.is_set():
-            for container in containers:
-                if self._stop_event.is_set():
-                    break
+            timestamp = time.time_ns()
+            tick_points: list[tuple[str, float, str, str]] = []
 
+            for container_id, stats in list(latest.items()):
                 try:
-                    stats_raw = container.stats(decode=None, stream=False)
-                    # Stats structure: {"cpu_stats": {...}, "memory_stats": {...}, "precpu_stats": {...}}
-                    stats: dict[str, Any] = stats_raw  # type: ignore[assignment]
-
-                    cpu_delta = (stats["cpu_stats"]["cpu_usage"]["total_usage"] -
-                                 stats["precpu_stats"]["cpu_usage"]["total_usage"])
-                    system_delta = (stats["cpu_stats"]["system_cpu_usage"] -
-                                    stats["precpu_stats"]["system_cpu_usage"])
-
-                    timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-                    container_name = container.name or "unknown"
-                    
-                    if system_delta > 0 and stats["cpu_stats"].get("online_cpus"):
+                    # Bind the nested stat dicts once instead of re-walking
+                    # them for every field
+                    cpu_stats = stats["cpu_stats"]
+                    precpu_stats = stats["precpu_stats"]
+                    cpu_delta = (cpu_stats["cpu_usage"]["total_usage"] -
+                                 precpu_stats["cpu_usage"]["total_usage"])
+                    system_delta = (cpu_stats["system_cpu_usage"] -
+                                    precpu_stats["system_cpu_usage"])
+                    online_cpus = cpu_stats.get("online_cpus")
+
+                    cached = series_cache.get(container_id)
+                    if cached is None:
+                        name = names.get(container_id, "unknown")
+                        cached = (
+                            name,
+                            self._get_series(
+                                self._docker_series,
+                                "cpu_percent", name, "docker"
+                            ),
+                            self._get_series(
+                                self._docker_series,
+                                "memory_usage", name, "docker"
+                            )
+                        )
+                        series_cache[container_id] = cached
+                    container_name, cpu_series, mem_series = cached
+
+                    if system_delta > 0 and online_cpus:
                         cpu_percent = ((cpu_delta / system_delta) *
-                                       stats["cpu_stats"]["online_cpus"] * 100)
-                        
+                                       online_cpus * 100)
+
                         # CPU point
-                        self._data_points.append(
-                            self._create_data_point(
-                                metric="cpu_percent",
-                                value=cpu_percent,
-                                target=container_name,
-                                method="docker",
-                                timestamp=timestamp
-                            )
+                        cpu_series["timestamps"].append(timestamp)
+                        cpu_series["values"].append(cpu_percent)
+                        tick_points.append(
+                            ("cpu_percent", cpu_percent, container_name, "docker")
                         )
 
                     mem = stats["memory_stats"]["usage"]
                     mem_mb = mem / 1e6
-                    
+
                     # Memory point
-                    self._data_points.append(
-                        self._create_data_point(
-                            metric="memory_usage",
-                            value=mem_mb,
-                            target=container_name,
-                            method="docker",
-                            timestamp=timestamp
-                        )
+                    mem_series["timestamps"].append(timestamp)
+                    mem_series["values"].append(mem_mb)
+                    tick_points.append(
+                        ("memory_usage", mem_mb, container_name, "docker")
                     )
-                except (KeyError, docker_errors.APIError):
+                except KeyError:
                     continue
 
-            self._stop_event.wait(self._poll_time)
+            if tick_points:
+                self._emit_points(tick_points, timestamp)
+
+            deadline = self._wait_next_tick(deadline)
+            if refresh_needed.is_set():
+                refresh_needed.clear()
+                refresh_streams()
+
+        # Actively close the stats streams instead of waiting for each
+        # reader to notice the stop event on its next frame
+        for response in list(responses.values()):
+            try:
+                response.close()
+            except OSError:
+                pass
 
     def _collect_psutil_stats(self) -> None:
         proc = psutil.Process()
-
+        proc_name = proc.name() or "unknown"
+        # Prime the delta baseline so the first sample is meaningful
+        proc.cpu_percent(interval=None)
+
+        # The psutil series are fixed for the whole run, so resolve their
+        # column buffers once instead of per sample
+        buffers = self._psutil_series
+        proc_cpu_series = self._get_series(buffers, "cpu_percent", proc_name, "default")
+        proc_mem_series = self._get_series(buffers, "memory_usage", proc_name, "default")
+        sys_cpu_series = self._get_series(buffers, "cpu_percent", "system", "default")
+        sys_mem_series = self._get_series(buffers, "memory_usage", "system", "default")
+
+        deadline = time.monotonic()
         while not self._stop_event.is_set():
             try:
-                proc_cpu = proc.cpu_percent()
-                proc_mem = proc.memory_info().rss / 1e6  # Memory in MB
+                # oneshot() caches the underlying /proc reads for both calls
+                with proc.oneshot():
+                    proc_cpu = proc.cpu_percent(interval=None)
+                    proc_mem = proc.memory_info().rss / 1e6  # Memory in MB
 
                 system_cpu = psutil.cpu_percent()
                 system_mem = psutil.virtual_memory().used / 1e6  # Memory in MB
 
-                timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-                proc_name = proc.name() or "unknown"
-
-                # Process CPU point
-                self._data_points.append(
-                    self._create_data_point(
-                        metric="cpu_percent",
-                        value=proc_cpu,
-                        target=proc_name,
-                        method="default",
-                        timestamp=timestamp
-                    )
-                )
-                
-                # Process memory point
-                self._data_points.append(
-                    self._create_data_point(
-                        metric="memory_usage",
-                        value=proc_mem,
-                        target=proc_name,
-                        method="default",
-                        timestamp=timestamp
-                    )
-                )
-                
-                # System CPU point
-                self._data_points.append(
-                    self._create_data_point(
-                        metric="cpu_percent",
-                        value=system_cpu,
-                        target="system",
-                        method="default",
-                        timestamp=timestamp
-                    )
+                timestamp = time.time_ns()
+
+                samples = (
+                    (proc_cpu_series, "cpu_percent", proc_name, proc_cpu),
+                    (proc_mem_series, "memory_usage", proc_name, proc_mem),
+                    (sys_cpu_series, "cpu_percent", "system", system_cpu),
+                    (sys_mem_series, "memory_usage", "system", system_mem)
                 )
-                
-                # System memory point
-                self._data_points.append(
-                    self._create_data_point(
-                        metric="memory_usage",
-                        value=system_mem,
-                        target="system",
-                        method="default",
-                        timestamp=timestamp
-                    )
+                for series, _metric, _target, value in samples:
+                    series["timestamps"].append(timestamp)
+                    series["values"].append(value)
+
+                self._emit_points(
+                    [
+                        (metric, value, target, "default")
+                        for _series, metric, target, value in samples
+                    ],
+                    timestamp
                 )
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 break
 
-            self._stop_event.wait(self._poll_time)
+            deadline = self._wait_next_tick(deadline)
 
     def on_startup(self, event: StartupEvent) -> None:
         if not self._enable_profiling:
@@ -263,7 +432,13 @@ class VedroProfilingPlugin(Plugin):
         else:
             self._run_id = f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
-        self._running = True
+        self._encode_point = self._compile_point_encoder()
+
+        try:
+            self._open_profiling_log()
+        except OSError as e:
+            warnings.warn(f"Failed to open profiling log: {e}")
+
         self._stop_event.clear()
 
         if "default" in self._profiling_methods:
@@ -287,47 +462,93 @@ class VedroProfilingPlugin(Plugin):
         os.makedirs(profiling_dir, exist_ok=True)
         return profiling_dir
     
-    def _write_profiling_log(self) -> None:
-        """Write metrics in NDJSON format (k6-compatible)"""
+    def _open_profiling_log(self) -> None:
+        """Open the NDJSON log (k6-compatible) and write metric definitions"""
         profiling_dir = self._ensure_profiling_dir()
         log_path = os.path.join(profiling_dir, "profiling.ndjson")
-        
-        with open(log_path, "w") as f:
-            # Write metric definitions first
-            for metric_name, definition in self._metrics_definitions.items():
-                metric_def = {
-                    "type": "Metric",
-                    "metric": metric_name,
-                    "data": definition
-                }
-                f.write(json.dumps(metric_def) + "\n")
-            
-            # Write data points
-            for point in self._data_points:
-                f.write(json.dumps(point) + "\n")
+
+        self._log_fh = open(log_path, "wb", buffering=1 << 20)
+        for metric_name, definition in self._metrics_definitions.items():
+            metric_def = {
+                "type": "Metric",
+                "metric": metric_name,
+                "data": definition
+            }
+            self._log_fh.write(orjson.dumps(metric_def) + b"\n")
+
+    def _emit_points(
+        self,
+        points: list[tuple[str, float, str, str]],
+        timestamp: int
+    ) -> None:
+        """Append one tick's (metric, value, target, method) points to the log."""
+        encode_point = self._encode_point
+        if self._log_fh is None or encode_point is None:
+            return
+
+        # One shared formatted timestamp and one write per tick
+        ts = str(np.datetime_as_string(
+            np.datetime64(timestamp, "ns"), unit="ms", timezone="UTC"
+        ))
+        lines = [
+            encode_point(metric, ts, value, target, method)
+            for metric, value, target, method in points
+        ]
+        # Re-check the handle under the lock: a collector that outlives the
+        # join timeout in on_cleanup must not write to a closed file
+        with self._log_lock:
+            fh = self._log_fh
+            if fh is None:
+                return
+            fh.writelines(lines)
+
+    def _close_profiling_log(self) -> None:
+        with self._log_lock:
+            fh = self._log_fh
+            self._log_fh = None
+        if fh is None:
+            return
+        fh.flush()
+        fh.close()
 
     def _prepare_stats_for_plotting(self) -> StatsDict:
-        """Convert data points to format for plotting"""
-        stats: StatsDict = defaultdict(
-            lambda: {"CPU": [], "MEM": [], "timestamps": []}
+        """Convert series buffers into per-target plot arrays"""
+        collected: dict[str, dict[str, list[Any]]] = defaultdict(
+            lambda: {"CPU": [], "MEM": [], "cpu_timestamps": [], "mem_timestamps": []}
         )
-        
-        for point in self._data_points:
-            target = point["data"]["tags"]["target"]
-            metric = point["metric"]
-            time = point["data"]["time"].rstrip("Z")  # Remove Z for parsing
-            
+
+        # Each metric keeps its own timestamp column: CPU points may be
+        # skipped on some ticks (e.g. no usable docker CPU delta), so the
+        # two columns are not guaranteed to stay aligned with each other
+        for (metric, target, _method), series in self._merged_series().items():
+            # Native datetime64 values: matplotlib consumes these directly,
+            # so there is no ISO string round-trip at plot time
+            times = np.asarray(series["timestamps"], dtype="datetime64[ns]")
             if metric == "cpu_percent":
-                stats[target]["CPU"].append(point["data"]["value"])
-                if time not in stats[target]["timestamps"]:
-                    stats[target]["timestamps"].append(time)
+                collected[target]["CPU"].extend(series["values"])
+                collected[target]["cpu_timestamps"].extend(times)
             elif metric == "memory_usage":
-                stats[target]["MEM"].append(point["data"]["value"])
-        
-        return dict(stats)
+                collected[target]["MEM"].extend(series["values"])
+                collected[target]["mem_timestamps"].extend(times)
+
+        # Convert once here so both the individual and the comparison
+        # plotters work on the same ready-made arrays
+        return {
+            target: {
+                "CPU": np.asarray(entry["CPU"], dtype=np.float64),
+                "MEM": np.asarray(entry["MEM"], dtype=np.float64),
+                "cpu_timestamps": np.asarray(
+                    entry["cpu_timestamps"], dtype="datetime64[ns]"
+                ),
+                "mem_timestamps": np.asarray(
+                    entry["mem_timestamps"], dtype="datetime64[ns]"
+                )
+            }
+            for target, entry in collected.items()
+        }
     
     def _generate_plots(self) -> None:
-        if not self._data_points:
+        if not self._docker_series and not self._psutil_series:
             return
 
         stats = self._prepare_stats_for_plotting()
@@ -335,27 +556,89 @@ class VedroProfilingPlugin(Plugin):
         plt.style.use('default')
         profiling_dir = self._ensure_profiling_dir()
 
-        for name, metrics in stats.items():
-            if not metrics["CPU"] and not metrics["MEM"]:
-                continue
+        # One reusable figure for all individual plots: axes are cleared
+        # between targets instead of paying figure setup/teardown per target
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+        try:
+            for name, metrics in stats.items():
+                if not metrics["CPU"].size and not metrics["MEM"].size:
+                    continue
 
-            self._create_individual_plot(name, metrics, profiling_dir)
+                ax1.clear()
+                ax2.clear()
+                self._create_individual_plot(name, metrics, profiling_dir, fig, ax1, ax2)
+        finally:
+            plt.close(fig)
 
         if len(stats) > 1:
             self._create_comparison_plot_from_stats(stats, profiling_dir)
 
+    def _apply_time_axis(self, ax: Axes, timestamps: NDArray[Any]) -> None:
+        """Shared time-axis formatting for the bottom axes of a plot."""
+        ax.xaxis.set_major_formatter(
+            mdates.DateFormatter('%H:%M:%S')  # type: ignore[no-untyped-call]
+        )
+        ax.xaxis.set_major_locator(
+            mdates.SecondLocator(  # type: ignore[no-untyped-call]
+                interval=max(1, len(timestamps) // 10)
+            )
+        )
+        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+    def _downsample_for_plot(
+        self,
+        times: NDArray[Any],
+        values: NDArray[np.float64],
+        max_points: int = 4000
+    ) -> tuple[NDArray[Any], NDArray[np.float64]]:
+        """Decimate a series to roughly the rendered pixel budget.
+
+        Keeps the min and max of each bucket so peaks and troughs survive
+        decimation; rendering cost drops with the number of segments drawn.
+        """
+        n = values.size
+        if n <= max_points:
+            return times, values
+
+        buckets = max_points // 2
+        usable = (n // buckets) * buckets
+        bucket_times = times[:usable].reshape(buckets, -1)
+        bucket_values = values[:usable].reshape(buckets, -1)
+
+        # Per bucket: positions of the extremes, kept in chronological order
+        extremes = np.sort(
+            np.stack(
+                [bucket_values.argmin(axis=1), bucket_values.argmax(axis=1)],
+                axis=1
+            ),
+            axis=1
+        )
+        rows = np.arange(buckets)[:, None]
+        out_times = bucket_times[rows, extremes].reshape(-1)
+        out_values = bucket_values[rows, extremes].reshape(-1)
+
+        if usable < n:
+            out_times = np.concatenate([out_times, times[-1:]])
+            out_values = np.concatenate([out_values, values[-1:]])
+        return out_times, out_values
+
     def _create_individual_plot(
         self,
         name: str,
         metrics: MetricStats,
-        profiling_dir: str
+        profiling_dir: str,
+        fig: Figure,
+        ax1: Axes,
+        ax2: Axes
     ) -> None:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
-
-        timestamps = [datetime.fromisoformat(str(ts)) for ts in metrics["timestamps"]]
-
-        if metrics["CPU"]:
-            ax1.plot(timestamps, metrics["CPU"], 'b-', linewidth=2, label='CPU Usage')
+        cpu_times = metrics["cpu_timestamps"]
+        mem_times = metrics["mem_timestamps"]
+        cpu_values = metrics["CPU"]
+        mem_values = metrics["MEM"]
+
+        if cpu_values.size:
+            plot_times, plot_values = self._downsample_for_plot(cpu_times, cpu_values)
+            ax1.plot(plot_times, plot_values, 'b-', linewidth=2, label='CPU Usage')
             ax1.set_ylabel('CPU Usage (%)', fontsize=12)
             ax1.set_title(
                 f'{name} - Resource Usage Over Time',
@@ -365,68 +648,70 @@ class VedroProfilingPlugin(Plugin):
             ax1.grid(True, alpha=0.3)
             ax1.legend()
 
-            cpu_stats = self._calculate_stats(metrics["CPU"])
+            cpu_stats = self._calculate_stats(cpu_values)
             stats_text = f'Avg: {cpu_stats["avg"]:.1f}% | Max: {cpu_stats["max"]:.1f}%'
             ax1.text(
                 0.02, 0.95, stats_text, transform=ax1.transAxes,
                 fontsize=9, verticalalignment='top'
             )
 
-        if metrics["MEM"]:
-            ax2.plot(timestamps, metrics["MEM"], 'r-', linewidth=2, label='Memory Usage')
+        if mem_values.size:
+            plot_times, plot_values = self._downsample_for_plot(mem_times, mem_values)
+            ax2.plot(plot_times, plot_values, 'r-', linewidth=2, label='Memory Usage')
             mem_label = 'Memory Usage (MB)'
             ax2.set_ylabel(mem_label, fontsize=12)
             ax2.set_xlabel('Time', fontsize=12)
             ax2.grid(True, alpha=0.3)
             ax2.legend()
 
-            mem_stats = self._calculate_stats(metrics["MEM"])
+            mem_stats = self._calculate_stats(mem_values)
             stats_text = f'Avg: {mem_stats["avg"]:.1f} MB | Max: {mem_stats["max"]:.1f} MB'
             ax2.text(
                 0.02, 0.95, stats_text, transform=ax2.transAxes,
                 fontsize=9, verticalalignment='top'
             )
 
-        ax2.xaxis.set_major_formatter(
-            mdates.DateFormatter('%H:%M:%S')  # type: ignore[no-untyped-call]
-        )
-        ax2.xaxis.set_major_locator(
-            mdates.SecondLocator(  # type: ignore[no-untyped-call]
-                interval=max(1, len(timestamps) // 10)
-            )
-        )
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+        axis_times = mem_times if mem_times.size else cpu_times
+        self._apply_time_axis(ax2, axis_times)
 
-        plt.tight_layout()
+        fig.tight_layout()
         plot_path = os.path.join(profiling_dir, f'{name}_profile.png')
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight')
 
     def _create_comparison_plot_from_stats(
         self,
         stats: StatsDict,
         profiling_dir: str
     ) -> None:
-        _, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
 
         colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown']
 
         for i, (name, metrics) in enumerate(stats.items()):
-            if not metrics["CPU"] and not metrics["MEM"]:
+            if not metrics["CPU"].size and not metrics["MEM"].size:
                 continue
 
-            timestamps = [datetime.fromisoformat(ts) for ts in metrics["timestamps"]]
+            cpu_times = metrics["cpu_timestamps"]
+            mem_times = metrics["mem_timestamps"]
+            cpu_values = metrics["CPU"]
+            mem_values = metrics["MEM"]
 
-            if metrics["CPU"]:
+            if cpu_values.size:
+                plot_times, plot_values = self._downsample_for_plot(
+                    cpu_times, cpu_values
+                )
                 ax1.plot(
-                    timestamps, metrics["CPU"],
+                    plot_times, plot_values,
                     color=colors[i % len(colors)],
                     linewidth=2, label=f'{name} CPU'
                 )
 
-            if metrics["MEM"]:
+            if mem_values.size:
+                plot_times, plot_values = self._downsample_for_plot(
+                    mem_times, mem_values
+                )
                 ax2.plot(
-                    timestamps, metrics["MEM"],
+                    plot_times, plot_values,
                     color=colors[i % len(colors)],
                     linewidth=2, label=f'{name} Memory', linestyle='--'
                 )
@@ -442,33 +727,33 @@ class VedroProfilingPlugin(Plugin):
         ax2.legend()
 
         if stats:
-            first_timestamps = [
-                datetime.fromisoformat(ts)
-                for ts in list(stats.values())[0]["timestamps"]
-            ]
-            ax2.xaxis.set_major_formatter(
-                mdates.DateFormatter('%H:%M:%S')  # type: ignore[no-untyped-call]
+            first_metrics = next(iter(stats.values()))
+            first_timestamps = (
+                first_metrics["mem_timestamps"]
+                if first_metrics["mem_timestamps"].size
+                else first_metrics["cpu_timestamps"]
             )
-            ax2.xaxis.set_major_locator(
-                mdates.SecondLocator(  # type: ignore[no-untyped-call]
-                    interval=max(1, len(first_timestamps) // 10)
-                )
-            )
-            plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+            self._apply_time_axis(ax2, first_timestamps)
 
-        plt.tight_layout()
+        fig.tight_layout()
         plot_path = os.path.join(profiling_dir, 'resource_comparison.png')
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight')
+        plt.close(fig)
 
-    def _calculate_stats(self, data: list[float]) -> dict[str, float]:
-        if not data:
+    def _calculate_stats(
+        self,
+        data: "list[float] | NDArray[np.float64]"
+    ) -> dict[str, float]:
+        values = np.asarray(data, dtype=np.float64)
+        if values.size == 0:
             return {"avg": 0, "max": 0, "min": 0}
 
+        # Single vectorized reduction per stat instead of a Python-level
+        # pass over the samples for each of sum/max/min
         return {
-            "avg": sum(data) / len(data),
-            "max": max(data),
-            "min": min(data)
+            "avg": float(values.mean()),
+            "max": float(values.max()),
+            "min": float(values.min())
         }
 
     def on_cleanup(self, event: CleanupEvent) -> None:
@@ -476,7 +761,6 @@ class VedroProfilingPlugin(Plugin):
             return
 
         self._stop_event.set()
-        self._running = False
 
         if self._docker_thread and self._docker_thread.is_alive():
             self._docker_thread.join(timeout=2.0)
@@ -484,7 +768,7 @@ class VedroProfilingPlugin(Plugin):
             self._psutil_thread.join(timeout=2.0)
 
         try:
-            self._write_profiling_log()
+            self._close_profiling_log()
         except (IOError, OSError) as e:
             warnings.warn(f"Failed to write profiling log: {e}")
         except Exception as e: